@@ -1,6 +1,6 @@
 import logging
 import re
-from typing import Self, Any, cast
+from typing import Self, Any, Callable, cast
 import psycopg2
 from .. import sql
 from ..sql import SQL
@@ -9,6 +9,23 @@ from ..exceptions import SillyORMException
 
 _logger = logging.getLogger(__name__)
 
+_PG_TYPE_MAP: dict[str, Callable[[int], sql.SqlType]] = {
+    "character varying": sql.SqlType.varchar,
+    "text": lambda _: sql.SqlType.text(),
+    "integer": lambda _: sql.SqlType.integer(),
+    "double precision": lambda _: sql.SqlType.float(),
+    "date": lambda _: sql.SqlType.date(),
+    "timestamp without time zone": lambda _: sql.SqlType.timestamp(),
+    "boolean": lambda _: sql.SqlType.boolean(),
+}
+
+
+def _str_type_to_sql_type(t: str, maxlen: int) -> sql.SqlType:
+    fn = _PG_TYPE_MAP.get(t)
+    if fn is None:
+        raise SillyORMException(f"unknown pg type '{t}'")
+    return fn(maxlen)
+
 
 # pylint: disable=duplicate-code
 class PostgreSQLCursor(sql.Cursor):
@@ -17,57 +34,49 @@ class PostgreSQLCursor(sql.Cursor):
 
     :param cr: cursor
     :type cr: psycopg2.extensions.cursor
+    :param connection: The connection the cursor belongs to
+    :type connection: :class:`sillyorm.sql.Connection` | None, optional
     """
 
-    def __init__(self, cr: psycopg2.extensions.cursor):
+    def __init__(self, cr: psycopg2.extensions.cursor, connection: sql.Connection | None = None):
         self._cr = cr
+        self.connection = connection
 
     def commit(self) -> None:
         self._cr.connection.commit()
+        if self.connection is not None:
+            self.connection.transaction_ended()
 
     def rollback(self) -> None:
         self._cr.connection.rollback()
+        if self.connection is not None:
+            self.connection.transaction_ended()
+
+    def in_transaction(self) -> bool:
+        return bool(
+            self._cr.connection.get_transaction_status()
+            != psycopg2.extensions.TRANSACTION_STATUS_IDLE
+        )
 
     def execute(self, sqlcode: sql.SQL) -> Self:
         if not isinstance(sqlcode, SQL):
             raise SillyORMException("SQL code must be enclosed in the SQL class")
         code = sqlcode.code()
-        _logger.debug("execute: %s", str(code))
+        _logger.debug("execute: %s", code)
         self._cr.execute(code)
         return self
 
     def fetchall(self) -> list[tuple[Any, ...]]:
         res = self._cr.fetchall()
-        _logger.debug("fetchall: %s", str(res))
+        _logger.debug("fetchall: %s", res)
         return res
 
     def fetchone(self) -> tuple[Any, ...]:
         res = self._cr.fetchone()
-        _logger.debug("fetchone: %s", str(res))
+        _logger.debug("fetchone: %s", res)
         return cast(tuple[Any, ...], res)
 
     def get_table_column_info(self, name: str) -> list[sql.ColumnInfo]:
-        def _str_type_to_sql_type(  # pylint: disable=too-many-return-statements
-            t: str, maxlen: int
-        ) -> sql.SqlType:
-            match t:
-                case "character varying":
-                    return sql.SqlType.varchar(maxlen)
-                case "text":
-                    return sql.SqlType.text()
-                case "integer":
-                    return sql.SqlType.integer()
-                case "double precision":
-                    return sql.SqlType.float()
-                case "date":
-                    return sql.SqlType.date()
-                case "timestamp without time zone":
-                    return sql.SqlType.timestamp()
-                case "boolean":
-                    return sql.SqlType.boolean()
-                case _:
-                    raise SillyORMException(f"unknown pg type '{t}'")
-
         res = self.execute(
             SQL(
                 "SELECT {i1}, {i2}, {i3} FROM information_schema.columns WHERE table_schema ="
@@ -86,12 +95,12 @@ class PostgreSQLCursor(sql.Cursor):
     def _table_exists(self, name: str) -> bool:
         res = self.execute(
             SQL(
-                "SELECT tablename FROM pg_tables WHERE schemaname = 'public' AND tablename ="
-                " {name};",
+                "SELECT EXISTS(SELECT 1 FROM pg_tables WHERE schemaname = 'public' AND tablename ="
+                " {name});",
                 name=SQL.escape(name),
             )
         ).fetchone()
-        return res == (name,)
+        return bool(res[0])
 
     def _alter_table_add_constraint(
         self,
@@ -125,7 +134,7 @@ class PostgreSQLConnection(sql.Connection):
         self._conn = psycopg2.connect(connstr, options=f"-c lock_timeout={lock_timeout}")
 
     def cursor(self) -> PostgreSQLCursor:
-        return PostgreSQLCursor(self._conn.cursor())
+        return PostgreSQLCursor(self._conn.cursor(), self)
 
     def close(self) -> None:
         self._conn.close()
@@ -15,39 +15,49 @@ class SQLiteCursor(sql.Cursor):
 
     :param cr: cursor
     :type cr: sqlite3.Cursor
+    :param connection: The connection the cursor belongs to
+    :type connection: :class:`sillyorm.sql.Connection` | None, optional
     """
 
-    def __init__(self, cr: sqlite3.Cursor):
+    # RETURNING was added in SQLite 3.35.0
+    supports_returning = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+    def __init__(self, cr: sqlite3.Cursor, connection: sql.Connection | None = None):
         self._cr = cr
+        self.connection = connection
 
     def commit(self) -> None:
         self._cr.connection.commit()
+        if self.connection is not None:
+            self.connection.transaction_ended()
 
     def rollback(self) -> None:
         self._cr.connection.rollback()
+        if self.connection is not None:
+            self.connection.transaction_ended()
+
+    def in_transaction(self) -> bool:
+        return self._cr.connection.in_transaction
 
     def execute(self, sqlcode: sql.SQL) -> Self:
         if not isinstance(sqlcode, SQL):
             raise SillyORMException("SQL code must be enclosed in the SQL class")
         code = sqlcode.code()
-        _logger.debug("execute: %s", str(code))
+        _logger.debug("execute: %s", code)
         self._cr.execute(code)
         return self
 
     def fetchall(self) -> list[tuple[Any, ...]]:
         res = self._cr.fetchall()
-        _logger.debug("fetchall: %s", str(res))
+        _logger.debug("fetchall: %s", res)
         return res
 
     def fetchone(self) -> tuple[Any, ...]:
         res = self._cr.fetchone()
-        _logger.debug("fetchone: %s", str(res))
+        _logger.debug("fetchone: %s", res)
         return cast(tuple[Any, ...], res)
 
     def get_table_column_info(self, name: str) -> list[sql.ColumnInfo]:
-        def _str_type_to_sql_type(t: str) -> sql.SqlType:
-            return sql.SqlType(t)
-
         res = self.execute(
             SQL(
                 "SELECT {i1}, {i2}, {i3} FROM PRAGMA_TABLE_INFO({table});",
@@ -60,7 +70,7 @@ class SQLiteCursor(sql.Cursor):
         return [
             sql.ColumnInfo(
                 n,
-                _str_type_to_sql_type(t),
+                sql.SqlType(t),
                 [sql.SqlConstraint.primary_key()] if pk else [],
             )
             for n, t, pk in res
@@ -69,11 +79,11 @@ class SQLiteCursor(sql.Cursor):
     def _table_exists(self, name: str) -> bool:
         res = self.execute(
             SQL(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name={name};",
+                "SELECT EXISTS(SELECT 1 FROM sqlite_master WHERE type='table' AND name={name});",
                 name=SQL.escape(name),
             )
         ).fetchone()
-        return res == (name,)
+        return bool(res[0])
 
     def _alter_table_add_constraint(
         self,
@@ -95,7 +105,7 @@ class SQLiteConnection(sql.Connection):
         self._conn = sqlite3.connect(*args, **kwargs)
 
     def cursor(self) -> SQLiteCursor:
-        return SQLiteCursor(self._conn.cursor())
+        return SQLiteCursor(self._conn.cursor(), self)
 
     def close(self) -> None:
         self._conn.close()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 import logging
-from typing import TYPE_CHECKING
-from . import sql
+from typing import TYPE_CHECKING, Any
+from . import sql, fields
 from .exceptions import SillyORMException
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -45,10 +45,32 @@ class Environment:
     :type do_commit: bool, optional
     """
 
+    __slots__ = (
+        "cr",
+        "do_commit",
+        "_models",
+        "_empty_recordsets",
+        "_cache",
+        "_inverse_fields",
+        "__weakref__",
+    )
+
     def __init__(self, cursor: sql.Cursor, do_commit: bool = True):
         self.cr = cursor
         self.do_commit = do_commit
         self._models: dict[str, type[Model]] = {}
+        # empty recordsets are immutable, so one per model is shared by all lookups
+        self._empty_recordsets: dict[str, Model] = {}
+        # record cache: model name -> record id -> field name -> value
+        # only valid within the current transaction, it is cleared on every commit and rollback
+        # and before reads outside of a transaction (see _drop_stale_cache)
+        self._cache: dict[str, dict[int, dict[str, Any]]] = {}
+        if self.cr.connection is not None:
+            # the connection only keeps a weak reference, so the environment can still be freed
+            self.cr.connection.add_transaction_callback(self.invalidate_cache)
+        # One2many fields: foreign model name -> (model name, field name, foreign field name)
+        # filled by register_model
+        self._inverse_fields: dict[str, set[tuple[str, str, str]]] = {}
 
     def register_model(self, model: type[Model]) -> None:
         """
@@ -71,6 +93,7 @@ class Environment:
             if extend not in self._models:
                 raise SillyORMException(f"cannot extend nonexistant model '{extend}'")
             old_model = self._models[extend]
+            self._empty_recordsets.pop(extend, None)
             self._models[extend] = type(
                 old_model.__name__,
                 (
@@ -79,6 +102,9 @@ class Environment:
                 ),
                 model.__dict__.copy(),
             )
+            # the field cache copied from the extension lacks the fields of the original model
+            self._models[extend]._fields_cache = None  # pylint: disable=protected-access
+            self._register_inverse_fields(self._models[extend])
             _logger.debug(
                 "extending model '%s'", old_model._name  # pylint: disable=protected-access
             )
@@ -88,13 +114,53 @@ class Environment:
             raise SillyORMException(f"cannot register model '{name}' twice")
         _logger.info("registering model '%s'", name)
         self._models[name] = model
+        # fields may have been added to the class after it was created
+        model._fields_cache = None  # pylint: disable=protected-access
+        self._empty_recordsets.pop(name, None)
+        self._register_inverse_fields(model)
+
+    def _register_inverse_fields(self, model: type[Model]) -> None:
+        # cached One2many values are invalidated through this mapping, so it must not
+        # depend on init_tables, the tables may have been set up by another environment
+        # pylint: disable=protected-access
+        for field in model._get_all_fields().values():
+            if isinstance(field, fields.One2many):
+                self._inverse_fields.setdefault(field._foreign_model, set()).add(
+                    (model._name, field.name, field._foreign_field)
+                )
 
     def init_tables(self) -> None:
         """
         Initializes database tables of all models registered in the environment
         """
-        for model in self._models.values():
-            model(self, [])._table_init()  # pylint: disable=protected-access
+        for name in self._models:
+            self[name]._table_init()  # pylint: disable=protected-access
+        # all tables are set up in a single transaction
+        self.cr.commit()
+
+    def invalidate_cache(self) -> None:
+        """
+        Clears the record cache of the environment.
+
+        Field values read through records are cached in the environment until the
+        current transaction ends (the cache is cleared on every commit and rollback
+        through any cursor of the connection). Values read outside of a transaction
+        are not reused by later reads.
+        Changes made through the ORM keep the cache up to date.
+        If the database is modified by other means within the same transaction (e.g. raw SQL)
+        this function should be called so the values are read from the database again.
+        """
+        self._cache.clear()
+
+    def _drop_stale_cache(self) -> None:
+        # without an open transaction other connections may change
+        # the database at any time, so nothing cached can be trusted
+        if not self.cr.in_transaction():
+            self._cache.clear()
 
     def __getitem__(self, key: str) -> Model:
-        return self._models[key](self, [])
+        recordset = self._empty_recordsets.get(key)
+        if recordset is None:
+            recordset = self._models[key](self, [])
+            self._empty_recordsets[key] = recordset
+        return recordset
@@ -35,9 +35,12 @@ class Field:
     constraints: list[sql.SqlConstraint] = []
 
     # set automatically
-    name: str = cast(str, None)
+    name: str
+
+    __slots__ = ("name",)
 
     def __init__(self) -> None:
+        self.name = cast(str, None)
         if self.materialize and self.sql_type is None:
             raise SillyORMException("sql_type must be set")
 
@@ -63,14 +66,12 @@ class Field:
         return value
 
     def __get__(self, record: Model, objtype: Any = None) -> Any | list[Any]:
-        record.ensure_one()
-        sql_result = record._read([self.name])
-        result = [self._convert_type_get(res[self.name]) for res in sql_result]
-        return result[0]
+        return record._read_cached(self.name)
 
     def __set__(self, record: Model, value: Any) -> None:
         if value is None:
             record._write({self.name: value})
+            return
         record._write({self.name: self._convert_type_set(value)})
 
 
@@ -114,6 +115,8 @@ class Integer(Field):
        None
     """
 
+    __slots__ = ()
+
     sql_type = sql.SqlType.integer()
 
     def _convert_type_set(self, value: Any) -> Any:
@@ -165,6 +168,8 @@ class Float(Field):
        None
     """
 
+    __slots__ = ()
+
     sql_type = sql.SqlType.float()
 
     def _convert_type_set(self, value: Any) -> Any:
@@ -200,11 +205,16 @@ class Id(Integer):
        2
     """
 
+    __slots__ = ()
+
     constraints = [sql.SqlConstraint.primary_key()]
 
     def __get__(self, record: Model, objtype: Any = None) -> int:
-        record.ensure_one()
-        return record._ids[0]
+        # same check as ensure_one, inlined since id is read very often
+        ids = record._ids
+        if len(ids) != 1:
+            raise SillyORMException(f"ensure_one found {len(ids)} id's")
+        return ids[0]
 
     def __set__(self, record: Model, value: Any) -> None:
         raise SillyORMException("cannot set id")
@@ -241,6 +251,8 @@ class String(Field):
 
     """
 
+    __slots__ = ("sql_type",)
+
     def __init__(self, length: int = 255) -> None:
         self.sql_type = sql.SqlType.varchar(length)
         super().__init__()
@@ -287,6 +299,8 @@ class Text(Field):
 
     """
 
+    __slots__ = ("sql_type",)
+
     def __init__(self) -> None:
         self.sql_type = sql.SqlType.text()
         super().__init__()
@@ -330,6 +344,8 @@ class Date(Field):
 
     """
 
+    __slots__ = ()
+
     sql_type = sql.SqlType.date()
 
     def _convert_type_get(self, value: Any) -> Any:
@@ -378,6 +394,8 @@ class Datetime(Field):
 
     """
 
+    __slots__ = ()
+
     sql_type = sql.SqlType.timestamp()
 
     def _convert_type_get(self, value: Any) -> Any:
@@ -432,6 +450,8 @@ class Boolean(Field):
        None
     """
 
+    __slots__ = ()
+
     sql_type = sql.SqlType.boolean()
 
     def _convert_type_get(self, value: Any) -> Any:
@@ -490,12 +510,15 @@ class Selection(String):
 
     """
 
+    __slots__ = ("options", "_options_set")
+
     def __init__(self, options: list[str], length: int = 255) -> None:
         self.options = options
+        self._options_set = frozenset(options)
         super().__init__(length)
 
     def _convert_type_set(self, value: Any) -> Any:
-        if not (isinstance(value, str) and value in self.options) and value is not None:
+        if not (isinstance(value, str) and value in self._options_set) and value is not None:
             raise SillyORMException("Selection value must be str and in the list of options")
         return value
 
@@ -545,6 +568,8 @@ class Many2one(Integer):
 
     """
 
+    __slots__ = ("_foreign_model", "constraints")
+
     def __init__(self, foreign_model: str):
         super().__init__()
         self._foreign_model = foreign_model
@@ -610,6 +635,8 @@ class One2many(Field):
 
     """
 
+    __slots__ = ("_foreign_model", "_foreign_field")
+
     materialize = False
 
     def __init__(self, foreign_model: str, foreign_field: str):
@@ -619,7 +646,30 @@ class One2many(Field):
 
     def __get__(self, record: Model, objtype: Any = None) -> None | Model:
         record.ensure_one()
-        return record.env[self._foreign_model].search([(self._foreign_field, "=", record.id)])
+        # pylint: disable=protected-access
+        record.env._drop_stale_cache()
+        record_id = record._ids[0]
+        model_cache = record._model_cache()
+        values = model_cache.setdefault(record_id, {})
+        if self.name not in values:
+            # read the field for all records the record was taken from with a single query
+            parent_ids = record._prefetch_ids_missing(self.name)
+            for parent_id, child_ids in self._search_many(record, parent_ids).items():
+                model_cache.setdefault(parent_id, {})[self.name] = child_ids
+        foreign = record.env[self._foreign_model]
+        return foreign.__class__(record.env, ids=list(values[self.name]))
+
+    def _search_many(self, record: Model, parent_ids: list[int]) -> dict[int, list[int]]:
+        foreign = record.env[self._foreign_model]
+        ret: dict[int, list[int]] = {parent_id: [] for parent_id in parent_ids}
+        # pylint: disable=protected-access
+        for child_id, parent_id in foreign._tblmngr.search_records(
+            record.env.cr,
+            ["id", self._foreign_field],
+            [(self._foreign_field, "in", parent_ids)],
+        ):
+            ret[parent_id].append(child_id)
+        return ret
 
     def __set__(self, record: Model, value: Model) -> None:
         raise NotImplementedError()
@@ -1,4 +1,6 @@
 import logging
+import itertools
+from operator import itemgetter
 from typing import Any, Iterator, Self
 from . import sql, fields
 from .sql import SQL
@@ -7,6 +9,9 @@ from .exceptions import SillyORMException
 
 _logger = logging.getLogger(__name__)
 
+# maximum amount of records read at once when a field is read through the cache
+PREFETCH_MAX = 1000
+
 
 class Model:
     """
@@ -65,30 +70,62 @@ class Model:
 
     _name = ""
     _extend = ""
+    _fields_cache: dict[str, fields.Field] | None = None
+    _tblmngr_cache: sql.TableManager | None = None
     id = fields.Id()  #: Special :class:`sillyorm.fields.Id` field used as PRIMARY KEY
 
     def __init__(self, env: Environment, ids: list[int]):
-        def get_all_fields() -> dict[str, fields.Field]:
+        if not self._name and not self._extend:
+            raise SillyORMException("_name or _extend must be set")
+
+        self._ids = ids
+        # ids of the recordset this one was taken from, used to batch reads
+        self._prefetch_ids = ids
+        self.env = env
+        self._tblmngr = self._get_tblmngr()
+        self._fields = self._get_all_fields()
+
+    @classmethod
+    def _get_tblmngr(cls) -> sql.TableManager:
+        """
+        Returns the table manager for the table of the model class.
+        Table managers only hold the table name, so one is shared by all recordsets of the class.
+
+        :return: The table manager
+        :rtype: :class:`sillyorm.sql.TableManager`
+        """
+        tblmngr: sql.TableManager | None = cls.__dict__.get("_tblmngr_cache")
+        if tblmngr is None or tblmngr.table_name != cls._name:
+            tblmngr = sql.TableManager(cls._name)
+            cls._tblmngr_cache = tblmngr
+        return tblmngr
+
+    @classmethod
+    def _get_all_fields(cls) -> dict[str, fields.Field]:
+        """
+        Returns all fields of the model class, including inherited ones.
+        The result is cached on the class, the cache is reset
+        by :func:`register_model <sillyorm.environment.Environment.register_model>`.
+
+        :return: The fields of the model keyed by their name
+        :rtype: dict[str, :class:`sillyorm.fields.Field`]
+        """
+        # look in the class itself only, subclasses must not use the cache of their parents
+        all_fields: dict[str, fields.Field] | None = cls.__dict__.get("_fields_cache")
+        if all_fields is None:
             all_fields = {}
-            for cls in self.__class__.__mro__:
-                if not issubclass(cls, Model):
+            for klass in cls.__mro__:
+                if not issubclass(klass, Model):
                     break
-                for attr in vars(cls).values():
+                for attr in vars(klass).values():
                     if not isinstance(attr, fields.Field):
                         continue
                     # fields from classes closer to the
                     # one this function was called on have priority
                     if attr.name not in all_fields:
                         all_fields[attr.name] = attr
-            return all_fields
-
-        if not self._name and not self._extend:
-            raise SillyORMException("_name or _extend must be set")
-
-        self._ids = ids
-        self.env = env
-        self._tblmngr = sql.TableManager(self._name)
-        self._fields = get_all_fields()
+            cls._fields_cache = all_fields
+        return all_fields
 
     def __repr__(self) -> str:
         ids = self._ids  # [record.id for record in self]
@@ -96,18 +133,39 @@ class Model:
 
     def __iter__(self) -> Iterator[Self]:
         for x in self._ids:
-            yield self.__class__(self.env, ids=[x])
+            yield self._sub_recordset([x])
 
     def __len__(self) -> int:
         return len(self._ids)
 
     def __getitem__(self, key: int) -> Self:
-        return self.__class__(self.env, ids=[self._ids[key]])
+        return self._sub_recordset([self._ids[key]])
+
+    def _sub_recordset(self, ids: list[int]) -> Self:
+        """
+        Returns a recordset with some of the ids of this recordset.
+        It shares the environment, table manager, fields and prefetch ids of this recordset,
+        so the constructor does not have to run again.
+
+        :param ids: The ids of the new recordset
+        :type ids: list[int]
+
+        :return: The new recordset
+        :rtype: Self
+        """
+        rec = object.__new__(self.__class__)
+        # pylint: disable=protected-access
+        rec._ids = ids
+        rec._prefetch_ids = self._prefetch_ids
+        rec.env = self.env
+        rec._tblmngr = self._tblmngr
+        rec._fields = self._fields
+        return rec
 
     def _table_init(self) -> None:
         _logger.debug("initializing table for model: '%s'", self._name)
         all_fields = list(self._fields.values())
-        _logger.debug("fields for model '%s': %s", self._name, repr(all_fields))
+        _logger.debug("fields for model '%s': %r", self._name, all_fields)
         # TODO: a way to disable updating tables manually so accidents don't happen? # pylint: disable=fixme
         self._tblmngr.table_init(
             self.env.cr,
@@ -116,10 +174,116 @@ class Model:
                 for field in all_fields
                 if field.materialize
             ],
+            # Environment.init_tables commits once all tables are set up
+            commit=False,
         )
         for field in all_fields:
             field.model_post_init(self)
 
+    def _model_cache(self) -> dict[int, dict[str, Any]]:
+        """
+        Returns the environment cache of the model, a dict mapping record ids
+        to dicts of cached field values
+
+        :return: The cache of the model
+        :rtype: dict[int, dict[str, Any]]
+        """
+        return self.env._cache.setdefault(self._name, {})  # pylint: disable=protected-access
+
+    def _prefetch_ids_missing(self, field_name: str) -> list[int]:
+        """
+        Returns the ids of the records the record was taken from that do not have
+        a field cached yet (up to ``PREFETCH_MAX`` records), always including the record itself
+
+        :param field_name: The field to check
+        :type field_name: str
+
+        :return: The ids to read the field for
+        :rtype: list[int]
+        """
+        self.ensure_one()
+        model_cache = self._model_cache()
+        record_id = self._ids[0]
+        # records before the current one have usually been read already when iterating,
+        # so start looking after it and stop once enough ids are found
+        try:
+            start = self._prefetch_ids.index(record_id) + 1
+        except ValueError:
+            start = 0
+        ids = [record_id]
+        for prefetch_id in itertools.chain(
+            itertools.islice(self._prefetch_ids, start, None),
+            itertools.islice(self._prefetch_ids, 0, start),
+        ):
+            if len(ids) >= PREFETCH_MAX:
+                break
+            if prefetch_id != record_id and field_name not in model_cache.get(prefetch_id, {}):
+                ids.append(prefetch_id)
+        return ids
+
+    def _read_cached(self, field_name: str) -> Any:
+        """
+        Reads a single field of a single record through the environment cache.
+        On a cache miss all materialized fields are read with a single query,
+        together with the other records of the recordset the record was taken from
+        (up to ``PREFETCH_MAX`` records).
+        Values are converted by the fields before they are cached,
+        so conversions only happen once per read from the DBMS.
+
+        :param field_name: The field to read
+        :type field_name: str
+
+        :return: The value of the field
+        :rtype: Any
+
+        :raises SillyORMException: If the record does not exist
+        """
+        self.ensure_one()
+        self.env._drop_stale_cache()  # pylint: disable=protected-access
+        record_id = self._ids[0]
+        model_cache = self._model_cache()
+        values = model_cache.get(record_id, {})
+        if field_name not in values:
+            ids = self._prefetch_ids_missing(field_name)
+            fetched = self._tblmngr.read_records(
+                self.env.cr,
+                [name for name, field in self._fields.items() if field.materialize],
+                SQL("WHERE {id} IN {ids}", id=SQL.identifier("id"), ids=SQL.set(ids)),
+            )
+            for row in fetched:
+                row_values = model_cache.setdefault(row["id"], {})
+                for name, v in row.items():
+                    # pylint: disable=protected-access
+                    row_values[name] = self._fields[name]._convert_type_get(v)
+            values = model_cache.get(record_id, {})
+            if field_name not in values:
+                raise SillyORMException(f"record {self._name}[{record_id}] does not exist")
+        return values[field_name]
+
+    def _invalidate_cache(self, field_names: list[str] | None = None) -> None:
+        """
+        Removes all records of the recordset from the environment cache.
+        Cached :class:`One2many <sillyorm.fields.One2many>` values of other models
+        that depend on the records are removed as well.
+
+        :param field_names:
+           The fields that changed, used to find the dependent
+           :class:`One2many <sillyorm.fields.One2many>` fields.
+           None if the records were created or deleted
+        :type field_names: list[str] | None
+        """
+        env_cache = self.env._cache  # pylint: disable=protected-access
+        model_cache = env_cache.get(self._name)
+        if model_cache is not None:
+            for record_id in self._ids:
+                model_cache.pop(record_id, None)
+        # pylint: disable=protected-access
+        for model_name, field_name, foreign_field in self.env._inverse_fields.get(self._name, ()):
+            if field_names is not None and foreign_field not in field_names:
+                continue
+            for values in env_cache.get(model_name, {}).values():
+                values.pop(field_name, None)
+
     def ensure_one(self) -> Self:
         """
         Makes sure the recordset contains exactly one record. Raises an exception otherwise
@@ -142,12 +306,11 @@ class Model:
            The fields read as a list of dictionaries.
         :rtype: list[dict[str, Any]]
         """
-        rdata = self._read(field_names)
-        for i, data in enumerate(rdata):
-            for f, v in data.items():
-                val = self._fields[f]._convert_type_get(v)  # pylint: disable=protected-access
-                rdata[i][f] = val
-        return rdata
+        # pylint: disable=protected-access
+        converters = [(f, self._fields[f]._convert_type_get) for f in field_names]
+        return [
+            {f: convert(data[f]) for f, convert in converters} for data in self._read(field_names)
+        ]
 
     def _read(self, field_names: list[str]) -> list[dict[str, Any]]:
         """
@@ -162,23 +325,17 @@ class Model:
         """
         if len(self._ids) == 0:
             return []
-        order_fix = SQL("")
+        where = SQL("WHERE {id} IN {ids}", id=SQL.identifier("id"), ids=SQL.set(self._ids))
         # no need to do the order mapping if we are just reading one
-        if len(self._ids) > 1:
-            order_fix += SQL("ORDER BY CASE {id} ", id=SQL.identifier("id"))
-            for i, x in enumerate(self._ids):
-                order_fix += SQL("WHEN {id} THEN {n} ", id=x, n=i + 1)
-            order_fix += SQL("END")
-        return self._tblmngr.read_records(
-            self.env.cr,
-            field_names,
-            SQL(
-                "WHERE {id} IN {ids} {order_fix}",
-                id=SQL.identifier("id"),
-                ids=SQL.set(self._ids),
-                order_fix=order_fix,
-            ),
+        if len(self._ids) == 1:
+            return self._tblmngr.read_records(self.env.cr, field_names, where)
+        # the rows are put into the order of the recordset here instead of in the DBMS
+        read_id = "id" not in field_names
+        rows = self._tblmngr.read_records(
+            self.env.cr, [*field_names, "id"] if read_id else field_names, where
         )
+        by_id = {row.pop("id") if read_id else row["id"]: row for row in rows}
+        return [by_id[x] for x in dict.fromkeys(self._ids) if x in by_id]
 
     def write(self, vals: dict[str, Any]) -> None:
         """
@@ -191,9 +348,12 @@ class Model:
            values for the fields
         :type vals: dict[str, Any]
         """
-        for f, v in vals.items():
-            vals[f] = self._fields[f]._convert_type_set(v)  # pylint: disable=protected-access
-        self._write(vals)
+        self._write(
+            {
+                f: self._fields[f]._convert_type_set(v)  # pylint: disable=protected-access
+                for f, v in vals.items()
+            }
+        )
 
     def _write(self, vals: dict[str, Any]) -> None:
         """
@@ -206,6 +366,9 @@ class Model:
            values for the fields
         :type vals: dict[str, Any]
         """
+        if not vals or not self._ids:
+            return
+        self._invalidate_cache(list(vals))
         self._tblmngr.update_records(
             self.env.cr,
             vals,
@@ -232,6 +395,8 @@ class Model:
         """
         if not isinstance(ids, list):
             ids = [ids]
+        if not ids:
+            return None
         res = self.env.cr.execute(
             SQL(
                 "SELECT {id} FROM {name} WHERE {id} IN {ids};",
@@ -242,7 +407,7 @@ class Model:
         ).fetchall()
         if len(res) == 0:
             return None
-        return self.__class__(self.env, ids=[id[0] for id in res])
+        return self.__class__(self.env, ids=list(map(itemgetter(0), res)))
 
     def create(self, vals: dict[str, Any]) -> Self:
         """
@@ -259,6 +424,58 @@ class Model:
            The recordset that was created (containing one record)
         :rtype: Self
         """
+        # the id is always assigned by the ORM
+        new_id = self._tblmngr.insert_record_next_id(
+            self.env.cr,
+            {
+                f: self._fields[f]._convert_type_set(v)  # pylint: disable=protected-access
+                for f, v in vals.items()
+                if f != "id"
+            },
+            "id",
+        )
+        if self.env.do_commit:
+            self.env.cr.commit()
+        record = self.__class__(self.env, ids=[new_id])
+        record._invalidate_cache()  # pylint: disable=protected-access
+        return record
+
+    def create_many(self, vals_list: list[dict[str, Any]]) -> Self:
+        """
+        Creates multiple records with the values provided.
+        All records are inserted with a single statement.
+
+        .. testcode:: models_model
+
+           class ExampleModel(sillyorm.model.Model):
+               _name = "example_create_many"
+               field = sillyorm.fields.String()
+
+           env.register_model(ExampleModel)
+           env.init_tables()
+
+           records = env["example_create_many"].create_many([{"field": "a"}, {"field": "b"}, {}])
+           print(records)
+           print([record.field for record in records])
+
+        .. testoutput:: models_model
+
+           example_create_many[1, 2, 3]
+           ['a', 'b', None]
+
+        :param vals_list:
+           The values for each record to create.
+           The keys represent the field
+           names and the values the
+           values for the fields
+        :type vals_list: list[dict[str, Any]]
+
+        :return:
+           The recordset that was created (containing one record per entry in ``vals_list``)
+        :rtype: Self
+        """
+        if not vals_list:
+            return self.__class__(self.env, ids=[])
         top_id = self.env.cr.execute(
             SQL(
                 "SELECT MAX({id}) FROM {table};",
@@ -268,13 +485,22 @@ class Model:
         ).fetchone()[0]
         if top_id is None:
             top_id = 0
-        vals["id"] = top_id + 1
-        for f, v in vals.items():
-            vals[f] = self._fields[f]._convert_type_set(v)  # pylint: disable=protected-access
-        self._tblmngr.insert_record(self.env.cr, vals)
+        ids = list(range(top_id + 1, top_id + 1 + len(vals_list)))
+        # the id is always assigned by the ORM, fields not set in some of the records are NULL
+        columns = list(dict.fromkeys(f for vals in vals_list for f in vals if f != "id"))
+        rows = []
+        for new_id, vals in zip(ids, vals_list):
+            row: list[Any] = [new_id]
+            for f in columns:
+                # pylint: disable=protected-access
+                row.append(self._fields[f]._convert_type_set(vals[f]) if f in vals else None)
+            rows.append(row)
+        self._tblmngr.insert_records(self.env.cr, ["id", *columns], rows)
         if self.env.do_commit:
             self.env.cr.commit()
-        return self.__class__(self.env, ids=[vals["id"]])
+        records = self.__class__(self.env, ids=ids)
+        records._invalidate_cache()  # pylint: disable=protected-access
+        return records
 
     def _domain_transform_types(
         self,
@@ -282,22 +508,26 @@ class Model:
     ) -> list[str | tuple[str, str, Any]]:
         # check types, just in case.. IT SHALL BE ENFORCED,
         # typechecking aint always right esp if u cast...!
+        # and call the _convert_type_set for each field so we can be sure we are
+        # comparing things correctly in the DB!
+        ret: list[str | tuple[str, str, Any]] = []
         for d in domain:
-            if not isinstance(d, (tuple, str)):
+            if isinstance(d, str):
+                ret.append(d)
+                continue
+            if not isinstance(d, tuple) or len(d) != 3:
+                raise SillyORMException("invalid domain")
+            field, op, value = d
+            if not isinstance(field, str) or not isinstance(op, str):
                 raise SillyORMException("invalid domain")
-            if isinstance(d, tuple):
-                if not isinstance(d[0], str) or not isinstance(d[1], str) or not len(d) == 3:
+            convert = self._fields[field]._convert_type_set  # pylint: disable=protected-access
+            if op == "in":
+                if not isinstance(value, (list, tuple)):
                     raise SillyORMException("invalid domain")
-        # call the _convert_type_set for each field so we can be sure we are
-        # comparing things correctly in the DB!
-        for i, d in enumerate(domain):
-            if isinstance(d, tuple):
-                domain[i] = (
-                    d[0],
-                    d[1],
-                    self._fields[d[0]]._convert_type_set(d[2]),  # pylint: disable=protected-access
-                )
-        return domain
+                ret.append((field, op, [convert(v) for v in value]))
+            else:
+                ret.append((field, op, convert(value)))
+        return ret
 
     # pylint: disable=too-many-arguments,too-many-positional-arguments
     def search(
@@ -335,6 +565,12 @@ class Model:
                     AND "test" = 'hello world!' )
                    OR "test2" = '2 Hii!!';
 
+        Supported comparison operators are
+        ``=``, ``!=``, ``>``, ``<``, ``>=``, ``<=`` and ``in``.
+        The value for ``in`` must be a list of values, e.g. ``("test", "in", ["a", "b"])``.
+        A ``None`` in that list matches records where the field is ``NULL``,
+        just like ``("test", "=", None)`` does.
+
         Usage example:
 
         .. testcode:: models_model
@@ -387,7 +623,7 @@ class Model:
             offset,
             limit,
         )
-        return self.__class__(self.env, ids=[id[0] for id in res])
+        return self.__class__(self.env, ids=list(map(itemgetter(0), res)))
 
     def search_count(
         self,
@@ -439,6 +675,9 @@ class Model:
         """
         Deletes all records in the recordset
         """
+        if not self._ids:
+            return
+        self._invalidate_cache()
         self._tblmngr.delete_records(
             self.env.cr,
             SQL("WHERE {id} IN {ids}", id=SQL.identifier("id"), ids=SQL.set(self._ids)),
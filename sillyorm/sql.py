@@ -1,10 +1,22 @@
 from __future__ import annotations
-from typing import Self, Any, cast, NamedTuple
+from typing import Self, Any, Callable, cast, NamedTuple
 import re
 import datetime
+import functools
+import inspect
+import weakref
 from .exceptions import SillyORMException
 
 
+@functools.lru_cache(maxsize=1024)
+def _identifier_code(name: str) -> str:
+    # table and column names repeat in almost every statement, so validating
+    # and quoting each distinct name once is enough
+    if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_@#]*$", name):
+        raise SillyORMException("invalid SQL identifier")
+    return f'"{name}"'
+
+
 class SqlType:
     """Class for SQL data types
 
@@ -189,7 +201,8 @@ class SQL:
         self._args = {}
         for k, v in kwargs.items():
             self._args[k] = self.__as_safe_sql_value(v)
-        self.code()
+        # SQL objects are immutable so the code only has to be rendered once
+        self._rendered = self._code.format(**self._args)
 
     @classmethod
     def escape(cls, value: str | int | float) -> Self:
@@ -233,6 +246,10 @@ class SQL:
         if isinstance(value, cls):
             return value.code()
 
+        # fast path for plain integers (ids), they never need escaping
+        if type(value) is int:  # pylint: disable=unidiomatic-typecheck
+            return str(value)
+
         return cls.escape(cast(str | int | float, value)).code()
 
     @classmethod
@@ -241,6 +258,7 @@ class SQL:
         ret = cls("")
         ret._code = "{v}"
         ret._args["v"] = code
+        ret._rendered = code
         return ret
 
     def code(self) -> str:
@@ -258,7 +276,7 @@ class SQL:
         :return: The resulting code
         :rtype: str
         """
-        return self._code.format(**self._args)
+        return self._rendered
 
     def __repr__(self) -> str:
         return f"SQL({self.code()})"
@@ -288,9 +306,7 @@ class SQL:
            :class:`SQL <sillyorm.sql.SQL>` class with the identifier in it
         :rtype: :class:`sillyorm.sql.SQL`
         """
-        if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_@#]*$", name):
-            raise SillyORMException("invalid SQL identifier")
-        return cls.__as_raw_sql(f'"{name}"')
+        return cls.__as_raw_sql(_identifier_code(name))
 
     @classmethod
     def commaseperated(cls, values: list[Any] | tuple[Any, ...]) -> Self:
@@ -311,11 +327,9 @@ class SQL:
            :class:`SQL <sillyorm.sql.SQL>` class with the list in it
         :rtype: :class:`sillyorm.sql.SQL`
         """
-        if isinstance(values, tuple):
-            values = list(values)
-        if not isinstance(values, list):
+        if not isinstance(values, (list, tuple)):
             values = [values]
-        return cls.__as_raw_sql(f"{', '.join([str(cls.__as_safe_sql_value(x)) for x in values])}")
+        return cls.__as_raw_sql(", ".join(map(cls.__as_safe_sql_value, values)))
 
     @classmethod
     def set(cls, values: list[Any] | tuple[Any, ...]) -> Self:
@@ -374,20 +388,46 @@ class ColumnInfo(NamedTuple):
 class Cursor:
     """
     Abstraction over standard python database cursors with extra features
+
+    :ivar connection: The connection the cursor belongs to, None if unknown
+    :vartype connection: :class:`sillyorm.sql.Connection` | None
     """
 
+    connection: Connection | None = None
+
+    #: Whether the DBMS supports ``INSERT ... RETURNING``
+    supports_returning: bool = True
+
     def commit(self) -> None:
         """
-        Commits the current transaction
+        Commits the current transaction.
+        Implementations must call
+        :func:`transaction_ended <sillyorm.sql.Connection.transaction_ended>`
+        of the :attr:`connection` afterwards.
         """
         raise NotImplementedError()  # pragma: no cover
 
     def rollback(self) -> None:
         """
-        Rolls back the current transaction
+        Rolls back the current transaction.
+        Implementations must call
+        :func:`transaction_ended <sillyorm.sql.Connection.transaction_ended>`
+        of the :attr:`connection` afterwards.
         """
         raise NotImplementedError()  # pragma: no cover
 
+    def in_transaction(self) -> bool:
+        """
+        Returns whether a transaction is currently open on the connection.
+
+        The default implementation always returns False,
+        environments then do not reuse cached values across reads.
+
+        :return: Whether a transaction is open
+        :rtype: bool
+        """
+        return False
+
     def execute(self, sqlcode: SQL) -> Self:
         """
         Executes SQL code
@@ -418,7 +458,7 @@ class Cursor:
         """
         raise NotImplementedError()  # pragma: no cover
 
-    def ensure_table(self, name: str, columns: list[ColumnInfo]) -> None:
+    def ensure_table(self, name: str, columns: list[ColumnInfo], commit: bool = True) -> None:
         """
         Makes sure a table with the specified name and columns exists.
         If any extra columns exist or their type does not match they will be removed.
@@ -428,8 +468,13 @@ class Cursor:
         :type name: str
         :param columns: The columns of the table
         :type columns: list[:class:`sillyorm.sql.ColumnInfo`]
+        :param commit:
+           Whether to commit the changes.
+           If False the caller is responsible for committing
+        :type commit: bool, optional
         """
-        if not self._table_exists(name):
+        current_columns = self._describe_table(name)
+        if current_columns is None:
             column_sql = [
                 *[
                     SQL(
@@ -452,9 +497,7 @@ class Cursor:
                     columns=SQL.set(column_sql),
                 )
             )
-            self.commit()
         else:
-            current_columns = self.get_table_column_info(name)
             add_columns = []
             remove_columns = []
 
@@ -511,6 +554,7 @@ class Cursor:
                 for constraint in column.constraints:
                     self._alter_table_add_constraint(name, column.name, constraint)
 
+        if commit:
             self.commit()
 
     def get_table_column_info(self, name: str) -> list[ColumnInfo]:
@@ -528,6 +572,12 @@ class Cursor:
     def _table_exists(self, name: str) -> bool:
         raise NotImplementedError()  # pragma: no cover
 
+    def _describe_table(self, name: str) -> list[ColumnInfo] | None:
+        # returns None if the table does not exist
+        if not self._table_exists(name):
+            return None
+        return self.get_table_column_info(name)
+
     def _constraint_to_sql(self, column: str, constraint: SqlConstraint) -> SQL:
         if constraint.kind == "FOREIGN KEY":
             return SQL(
@@ -551,6 +601,8 @@ class Connection:
     For managing database connections
     """
 
+    _transaction_callbacks: list[weakref.ref[Callable[[], None]]]
+
     def cursor(self) -> Cursor:
         """
         Gets a database cursor from the connection
@@ -566,6 +618,39 @@ class Connection:
         """
         raise NotImplementedError()  # pragma: no cover
 
+    def add_transaction_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Registers a function that is called every time a transaction on the
+        connection ends (after each commit and rollback through any of its cursors).
+
+        Only a weak reference to the function is kept, it is no longer called
+        once it (or the object of a bound method) has been garbage collected.
+
+        :param callback: The function to call
+        :type callback: Callable[[], None]
+        """
+        if not hasattr(self, "_transaction_callbacks"):
+            self._transaction_callbacks = []
+        if inspect.ismethod(callback):
+            self._transaction_callbacks.append(weakref.WeakMethod(callback))
+        else:
+            self._transaction_callbacks.append(weakref.ref(callback))
+
+    def transaction_ended(self) -> None:
+        """
+        Calls the functions registered with
+        :func:`add_transaction_callback <sillyorm.sql.Connection.add_transaction_callback>`.
+        :class:`Cursor <sillyorm.sql.Cursor>` implementations must call this
+        after each commit and rollback.
+        """
+        alive: list[weakref.ref[Callable[[], None]]] = []
+        for ref in getattr(self, "_transaction_callbacks", []):
+            callback = ref()
+            if callback is not None:
+                alive.append(ref)
+                callback()
+        self._transaction_callbacks = alive
+
 
 class TableManager:
     """
@@ -578,7 +663,7 @@ class TableManager:
     def __init__(self, table_name: str):
         self.table_name = table_name
 
-    def table_init(self, cr: Cursor, columns: list[ColumnInfo]) -> None:
+    def table_init(self, cr: Cursor, columns: list[ColumnInfo], commit: bool = True) -> None:
         """
         Initializes the database table
 
@@ -586,8 +671,12 @@ class TableManager:
         :type cr: :class:`sillyorm.sql.Cursor`
         :param columns: The columns the table should have
         :type columns: list[:class:`sillyorm.sql.ColumnInfo`]
+        :param commit:
+           Whether to commit the changes.
+           If False the caller is responsible for committing
+        :type commit: bool, optional
         """
-        cr.ensure_table(self.table_name, columns)
+        cr.ensure_table(self.table_name, columns, commit)
 
     def read_records(self, cr: Cursor, columns: list[str], extra_sql: SQL) -> list[dict[str, Any]]:
         """
@@ -608,7 +697,6 @@ class TableManager:
            read from the specified column
         :rtype: list[dict[str, Any]]
         """
-        ret = []
         cr.execute(
             SQL(
                 "SELECT {columns} FROM {table} {extra_sql};",
@@ -617,12 +705,7 @@ class TableManager:
                 extra_sql=extra_sql,
             )
         )
-        for rec in cr.fetchall():
-            data = {}
-            for i, field in enumerate(columns):
-                data[field] = rec[i]
-            ret.append(data)
-        return ret
+        return [dict(zip(columns, rec)) for rec in cr.fetchall()]
 
     def insert_record(self, cr: Cursor, vals: dict[str, Any]) -> None:
         """
@@ -643,6 +726,64 @@ class TableManager:
             )
         )
 
+    def insert_record_next_id(self, cr: Cursor, vals: dict[str, Any], id_column: str) -> int:
+        """
+        Creates a record with the next free id (highest id + 1).
+        The id is computed and returned by the same statement
+        if the cursor :attr:`supports_returning <sillyorm.sql.Cursor.supports_returning>`,
+        otherwise it is queried before inserting the record.
+
+        :param cr: The cursor to use
+        :type cr: :class:`sillyorm.sql.Cursor`
+        :param vals: The values for the columns (without the id column)
+        :type vals: dict[str, Any]
+        :param id_column: The name of the id column
+        :type id_column: str
+
+        :return: The id of the record created
+        :rtype: int
+        """
+        next_id = SQL(
+            "(SELECT COALESCE(MAX({id}), 0) + 1 FROM {table})",
+            id=SQL.identifier(id_column),
+            table=SQL.identifier(self.table_name),
+        )
+        if not cr.supports_returning:
+            new_id = int(cr.execute(SQL("SELECT {next_id};", next_id=next_id)).fetchone()[0])
+            self.insert_record(cr, {id_column: new_id, **vals})
+            return new_id
+        return int(
+            cr.execute(
+                SQL(
+                    "INSERT INTO {table} {keys} VALUES {values} RETURNING {id};",
+                    table=SQL.identifier(self.table_name),
+                    keys=SQL.set([SQL.identifier(key) for key in [id_column, *vals]]),
+                    values=SQL.set([next_id, *vals.values()]),
+                    id=SQL.identifier(id_column),
+                )
+            ).fetchone()[0]
+        )
+
+    def insert_records(self, cr: Cursor, columns: list[str], rows: list[list[Any]]) -> None:
+        """
+        Creates multiple records with a single statement
+
+        :param cr: The cursor to use
+        :type cr: :class:`sillyorm.sql.Cursor`
+        :param columns: The names of the columns
+        :type columns: list[str]
+        :param rows: The values for the columns, one list per record
+        :type rows: list[list[Any]]
+        """
+        cr.execute(
+            SQL(
+                "INSERT INTO {table} {keys} VALUES {values};",
+                table=SQL.identifier(self.table_name),
+                keys=SQL.set([SQL.identifier(column) for column in columns]),
+                values=SQL.commaseperated([SQL.set(row) for row in rows]),
+            )
+        )
+
     def update_records(self, cr: Cursor, column_vals: dict[str, Any], extra_sql: SQL) -> None:
         """
         Updates records
@@ -700,6 +841,21 @@ class TableManager:
             return SQL(ops[op])
 
         def parse_criteria(op: tuple[str, str, Any]) -> SQL:
+            if op[1] == "in":
+                # NULL never compares equal in "IN (...)", so it's matched separately
+                vals = [v for v in op[2] if v is not None]
+                null_sql = SQL(" {field} IS NULL ", field=SQL.identifier(op[0]))
+                if len(vals) == 0:
+                    # "IN ()" is not valid SQL in every DBMS
+                    return null_sql if len(vals) != len(op[2]) else SQL(" 1 = 0 ")
+                in_sql = SQL(
+                    " {field} IN {vals} ",
+                    field=SQL.identifier(op[0]),
+                    vals=SQL.set(vals),
+                )
+                if len(vals) != len(op[2]):
+                    return SQL(" (") + in_sql + SQL("OR") + null_sql + SQL(") ")
+                return in_sql
             return SQL(
                 " {field} {op} {val} ",
                 field=SQL.identifier(op[0]),
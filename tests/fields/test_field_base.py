@@ -1,6 +1,7 @@
 import pytest
 import sillyorm
 from sillyorm.exceptions import SillyORMException
+from ..libtest import with_test_env, count_queries
 
 
 def test_field_base():
@@ -11,3 +12,20 @@ def test_field_base():
             impossible = sillyorm.fields.Field()
 
     assert str(e_info.value) == "sql_type must be set"
+
+
+@with_test_env()
+def test_set_none_single_write(env):
+    class Model(sillyorm.model.Model):
+        _name = "model"
+
+        a = sillyorm.fields.String()
+
+    env.register_model(Model)
+    env.init_tables()
+
+    record = env["model"].create({"a": "hello"})
+    queries = count_queries(env)
+    record.a = None
+    assert len([q for q in queries if q.startswith("UPDATE")]) == 1
+    assert record.a is None
@@ -9,12 +9,13 @@ from sillyorm.dbms import sqlite
 from sillyorm.environment import Environment
 from sillyorm.sql import Cursor, SqlType
 
+_PG_CONNSTR = "host=127.0.0.1 user=postgres password=postgres"
 
-def _pg_conn(tmp_path: Path) -> postgresql.PostgreSQLConnection:
+
+def pg_conn(tmp_path: Path) -> postgresql.PostgreSQLConnection:
     dbname = f"pytestdb{hash(str(tmp_path))}"
-    connstr = "host=127.0.0.1 user=postgres password=postgres"
 
-    conn = psycopg2.connect(connstr + " dbname=postgres")
+    conn = psycopg2.connect(_PG_CONNSTR + " dbname=postgres")
     conn.autocommit = True
     cr = conn.cursor()
     cr.execute(f"SELECT datname FROM pg_catalog.pg_database WHERE datname = '{dbname}';")
@@ -22,10 +23,10 @@ def _pg_conn(tmp_path: Path) -> postgresql.PostgreSQLConnection:
         cr.execute(f'CREATE DATABASE "{dbname}";')
     conn.close()
 
-    return postgresql.PostgreSQLConnection(connstr + f" dbname={dbname}")
+    return postgresql.PostgreSQLConnection(_PG_CONNSTR + f" dbname={dbname}")
 
 
-def _sqlite_conn(tmp_path: Path) -> sqlite.SQLiteConnection:
+def sqlite_conn(tmp_path: Path) -> sqlite.SQLiteConnection:
     dbpath = tmp_path / "test.db"
     return sqlite.SQLiteConnection(str(dbpath))
 
@@ -52,12 +53,24 @@ def with_test_env(reinit: bool = False) -> Any:
                 run_test(True, ret)
 
         return pytest.mark.parametrize(
-            "db_conn_fn", [(_sqlite_conn), (_pg_conn)], ids=["SQLite", "PostgreSQL"]
+            "db_conn_fn", [(sqlite_conn), (pg_conn)], ids=["SQLite", "PostgreSQL"]
         )(wrapper)
 
     return inner_fn
 
 
+def count_queries(env):
+    queries = []
+    execute = env.cr.execute
+
+    def counting_execute(sqlcode):
+        queries.append(sqlcode.code())
+        return execute(sqlcode)
+
+    env.cr.execute = counting_execute
+    return queries
+
+
 def assert_db_columns(cr: Cursor, table: str, columns: list[tuple[str, SqlType]]) -> None:
     info = [(info.name, info.type) for info in cr.get_table_column_info(table)]
     assert len(info) == len(columns)
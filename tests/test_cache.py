@@ -0,0 +1,311 @@
+import gc
+import weakref
+import pytest
+import sillyorm
+from sillyorm.exceptions import SillyORMException
+from .libtest import with_test_env, count_queries, pg_conn, sqlite_conn
+
+
+@with_test_env()
+def test_cache_single_read(env):
+    class Model(sillyorm.model.Model):
+        _name = "model"
+
+        a = sillyorm.fields.String()
+        b = sillyorm.fields.Integer()
+        c = sillyorm.fields.Boolean()
+
+    env.register_model(Model)
+    env.init_tables()
+
+    record_id = env["model"].create({"a": "hello", "b": 5, "c": True}).id
+    env.invalidate_cache()
+    queries = count_queries(env)
+
+    record = env["model"].browse(record_id)
+    queries.clear()
+    assert record.a == "hello"
+    assert record.b == 5
+    assert record.c is True
+    assert record.a == "hello"
+    assert len(queries) == 1
+
+
+@with_test_env()
+def test_cache_invalidation(env):
+    class Model(sillyorm.model.Model):
+        _name = "model"
+
+        a = sillyorm.fields.String()
+        b = sillyorm.fields.Integer()
+
+    env.register_model(Model)
+    env.init_tables()
+
+    record = env["model"].create({"a": "hello", "b": 5})
+    other = env["model"].browse(record.id)
+    assert other.a == "hello"
+    assert other.b == 5
+
+    # writes through a different recordset must be visible
+    record.a = "world"
+    assert other.a == "world"
+    env["model"].browse([record.id]).write({"b": 6})
+    assert other.b == 6
+
+    # changes made outside the ORM are only visible after invalidating the cache
+    env.cr.execute(
+        sillyorm.sql.SQL(
+            "UPDATE {t} SET {a} = 'raw';",
+            t=sillyorm.sql.SQL.identifier("model"),
+            a=sillyorm.sql.SQL.identifier("a"),
+        )
+    )
+    assert other.a == "world"
+    env.invalidate_cache()
+    assert other.a == "raw"
+
+    # reading a deleted record fails and does not leave anything in the cache
+    record_id = record.id
+    record.delete()
+    with pytest.raises(SillyORMException) as e_info:
+        other.a
+    assert str(e_info.value) == f"record model[{record_id}] does not exist"
+    assert record_id not in env._cache.get("model", {})
+
+
+@with_test_env()
+def test_cache_one2many(env):
+    class SaleOrder(sillyorm.model.Model):
+        _name = "sale_order"
+
+        line_ids = sillyorm.fields.One2many("sale_order_line", "order_id")
+
+    class SaleOrderLine(sillyorm.model.Model):
+        _name = "sale_order_line"
+
+        order_id = sillyorm.fields.Many2one("sale_order")
+
+    env.register_model(SaleOrder)
+    env.register_model(SaleOrderLine)
+    env.init_tables()
+
+    orders = [env["sale_order"].create({}) for _ in range(5)]
+    for order in orders[:4]:
+        env["sale_order_line"].create({"order_id": order.id})
+        env["sale_order_line"].create({"order_id": order.id})
+    env.invalidate_cache()
+    queries = count_queries(env)
+
+    # the field is read for all iterated records at once
+    all_orders = env["sale_order"].search([])
+    queries.clear()
+    assert [order.line_ids._ids for order in all_orders] == [
+        [1, 2],
+        [3, 4],
+        [5, 6],
+        [7, 8],
+        [],
+    ]
+    assert len(queries) == 1
+
+    # creating, writing and deleting lines updates the orders
+    line = env["sale_order_line"].create({"order_id": orders[4].id})
+    assert all_orders[4].line_ids._ids == [line.id]
+    line.order_id = orders[0]
+    assert all_orders[0].line_ids._ids == [1, 2, line.id]
+    assert all_orders[4].line_ids._ids == []
+    line.delete()
+    assert all_orders[0].line_ids._ids == [1, 2]
+
+    # the amount of records read at once is limited
+    env.invalidate_cache()
+    prefetch_max = sillyorm.model.PREFETCH_MAX
+    sillyorm.model.PREFETCH_MAX = 2
+    try:
+        queries.clear()
+        assert [order.line_ids._ids for order in all_orders] == [
+            [1, 2],
+            [3, 4],
+            [5, 6],
+            [7, 8],
+            [],
+        ]
+        assert len(queries) == 3
+    finally:
+        sillyorm.model.PREFETCH_MAX = prefetch_max
+
+
+@pytest.mark.parametrize("db_conn_fn", [(sqlite_conn), (pg_conn)], ids=["SQLite", "PostgreSQL"])
+def test_cache_one2many_without_init_tables(tmp_path, db_conn_fn):
+    class Parent(sillyorm.model.Model):
+        _name = "p"
+
+        child_ids = sillyorm.fields.One2many("c", "p_id")
+
+    class Child(sillyorm.model.Model):
+        _name = "c"
+
+        p_id = sillyorm.fields.Many2one("p")
+
+    env = sillyorm.Environment(db_conn_fn(tmp_path).cursor())
+    env.register_model(Parent)
+    env.register_model(Child)
+    env.init_tables()
+
+    # the tables already exist, so they are not initialized again
+    env = sillyorm.Environment(db_conn_fn(tmp_path).cursor(), do_commit=False)
+    env.register_model(Parent)
+    env.register_model(Child)
+    parent = env["p"].create({})
+    assert parent.child_ids._ids == []
+    child = env["c"].create({"p_id": parent.id})
+    assert parent.child_ids._ids == [child.id]
+    env.cr.rollback()
+
+
+@with_test_env()
+def test_cache_many2one(env):
+    class Partner(sillyorm.model.Model):
+        _name = "partner"
+
+        name = sillyorm.fields.String()
+
+    class SaleOrder(sillyorm.model.Model):
+        _name = "sale_order"
+
+        partner_id = sillyorm.fields.Many2one("partner")
+
+    env.register_model(Partner)
+    env.register_model(SaleOrder)
+    env.init_tables()
+
+    partner = env["partner"].create({"name": "test"})
+    order = env["sale_order"].create({"partner_id": partner.id})
+    env.invalidate_cache()
+    queries = count_queries(env)
+
+    assert order.partner_id.name == "test"
+    assert len(queries) == 3
+    # the partner is browsed again to make sure it still exists, its name is cached
+    assert order.partner_id.name == "test"
+    assert len(queries) == 4
+
+    partner.delete()
+    assert order.partner_id is None
+
+
+@with_test_env()
+def test_cache_prefetch(env):
+    class Model(sillyorm.model.Model):
+        _name = "model"
+
+        a = sillyorm.fields.String()
+        b = sillyorm.fields.Integer()
+
+    env.register_model(Model)
+    env.init_tables()
+
+    for i in range(10):
+        env["model"].create({"a": f"record {i}", "b": i})
+    env.invalidate_cache()
+    queries = count_queries(env)
+
+    records = env["model"].search([])
+    queries.clear()
+    assert [(record.a, record.b) for record in records] == [(f"record {i}", i) for i in range(10)]
+    assert len(queries) == 1
+
+    # records outside of the recordset are not read
+    assert len(env._cache["model"]) == 10
+    records[3].write({"b": 30})
+    queries.clear()
+    assert records[3].b == 30
+    assert records[4].b == 4
+    assert len(queries) == 1
+
+
+@with_test_env()
+def test_cache_transaction(env):
+    class Model(sillyorm.model.Model):
+        _name = "model"
+
+        a = sillyorm.fields.String()
+
+    env.register_model(Model)
+    env.init_tables()
+
+    record = env["model"].create({"a": "x"})
+    env.cr.commit()
+
+    # a rollback discards the cached values
+    record.a = "y"
+    assert record.a == "y"
+    env.cr.rollback()
+    assert record.a == "x"
+
+    # so does a commit
+    record.a = "z"
+    queries = count_queries(env)
+    assert record.a == "z"
+    assert len(queries) == 1
+    assert record.a == "z"
+    assert len(queries) == 1
+    env.cr.commit()
+    assert record.a == "z"
+    assert len(queries) == 2
+
+
+@pytest.mark.parametrize("db_conn_fn", [(sqlite_conn), (pg_conn)], ids=["SQLite", "PostgreSQL"])
+def test_cache_shared_connection(tmp_path, db_conn_fn):
+    class Model(sillyorm.model.Model):
+        _name = "model"
+
+        a = sillyorm.fields.String()
+
+    conn = db_conn_fn(tmp_path)
+    env1 = sillyorm.Environment(conn.cursor(), do_commit=False)
+    env2 = sillyorm.Environment(conn.cursor(), do_commit=False)
+    env1.register_model(Model)
+    env2.register_model(Model)
+    env1.init_tables()
+
+    record_id = env1["model"].create({"a": "x"}).id
+    assert env2["model"].browse(record_id).a == "x"
+
+    # a commit through the cursor of another environment clears the cache as well
+    env1["model"].browse(record_id).a = "y"
+    env1.cr.commit()
+    env1["model"].create({"a": "new transaction"})
+    assert env2["model"].browse(record_id).a == "y"
+    env1.cr.rollback()
+
+    # environments are not kept alive by the connection
+    env_ref = weakref.ref(env2)
+    del env2
+    gc.collect()
+    assert env_ref() is None
+    env1.cr.commit()
+    conn.close()
+
+
+def test_cache_other_connection(tmp_path):
+    # SQLite does not open a transaction for reads
+    class Model(sillyorm.model.Model):
+        _name = "model"
+
+        a = sillyorm.fields.String()
+
+    writer = sillyorm.Environment(sqlite_conn(tmp_path).cursor())
+    reader = sillyorm.Environment(sqlite_conn(tmp_path).cursor())
+    writer.register_model(Model)
+    reader.register_model(Model)
+    writer.init_tables()
+
+    record_id = writer["model"].create({"a": "x"}).id
+    record = reader["model"].browse(record_id)
+    assert record.a == "x"
+
+    # values read outside of a transaction are not reused
+    writer["model"].browse(record_id).a = "y"
+    assert record.a == "y"
@@ -14,3 +14,23 @@ def test_model_register_twice(env):
     with pytest.raises(SillyORMException) as e_info:
         env.register_model(Model1)
     assert str(e_info.value) == "cannot register model 'a' twice"
+
+
+@with_test_env()
+def test_model_empty_recordset_shared(env):
+    class Model1(sillyorm.model.Model):
+        _name = "a"
+
+    class Model1Extension(sillyorm.model.Model):
+        _extend = "a"
+
+        field = sillyorm.fields.String()
+
+    env.register_model(Model1)
+    assert env["a"] is env["a"]
+    assert len(env["a"]) == 0
+    before_extend = env["a"]
+
+    env.register_model(Model1Extension)
+    assert env["a"] is not before_extend
+    assert isinstance(env["a"], Model1Extension)
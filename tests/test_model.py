@@ -1,30 +1,9 @@
 import re
 import pytest
-import psycopg2
 import sillyorm
-from sillyorm.dbms import sqlite
-from sillyorm.dbms import postgresql
 from sillyorm.sql import SqlType
 from sillyorm.exceptions import SillyORMException
-from .libtest import assert_db_columns
-
-
-def pg_conn(tmp_path):
-    dbname = f"pytestdb{hash(str(tmp_path))}"
-    connstr = "host=127.0.0.1 user=postgres password=postgres"
-    conn = psycopg2.connect(connstr + " dbname=postgres")
-    conn.autocommit = True
-    cr = conn.cursor()
-    cr.execute(f"SELECT datname FROM pg_catalog.pg_database WHERE datname = '{dbname}';")
-    if cr.fetchone() is None:
-        cr.execute(f'CREATE DATABASE "{dbname}";')
-
-    return postgresql.PostgreSQLConnection(connstr + f" dbname={dbname}")
-
-
-def sqlite_conn(tmp_path):
-    dbpath = tmp_path / "test.db"
-    return sqlite.SQLiteConnection(dbpath)
+from .libtest import assert_db_columns, pg_conn, sqlite_conn
 
 
 def test_model_name():
@@ -95,6 +74,21 @@ def test_model_init(tmp_path, db_conn_fn):
     conn.close()
 
 
+@pytest.mark.parametrize("db_conn_fn", [(sqlite_conn), (pg_conn)])
+def test_ensure_table_commit(tmp_path, db_conn_fn):
+    conn = db_conn_fn(tmp_path)
+    sillyorm.sql.TableManager("test_table").table_init(
+        conn.cursor(), [sillyorm.sql.ColumnInfo("test", SqlType.integer(), [])]
+    )
+    conn.cursor().ensure_table("test_table2", [sillyorm.sql.ColumnInfo("test", SqlType.text(), [])])
+    conn.close()
+
+    conn = db_conn_fn(tmp_path)
+    assert_db_columns(conn.cursor(), "test_table", [("test", SqlType.integer())])
+    assert_db_columns(conn.cursor(), "test_table2", [("test", SqlType.text())])
+    conn.close()
+
+
 @pytest.mark.parametrize("db_conn_fn", [(sqlite_conn), (pg_conn)])
 def test_field_add_remove(tmp_path, db_conn_fn):
     class TestModel(sillyorm.model.Model):
@@ -583,3 +577,69 @@ def test_model_subscript(tmp_path, db_conn_fn):
     assert env["test_model"].search([])[0]._ids == [1]
     assert env["test_model"].search([])[1]._ids == [2]
     assert env["test_model"].search([])[2]._ids == [3]
+
+
+@pytest.mark.parametrize("db_conn_fn", [(sqlite_conn), (pg_conn)])
+def test_create_many(tmp_path, db_conn_fn):
+    class TestModel(sillyorm.model.Model):
+        _name = "test_model"
+
+        test = sillyorm.fields.String()
+        test2 = sillyorm.fields.Integer()
+
+    env = sillyorm.Environment(db_conn_fn(tmp_path).cursor())
+    env.register_model(TestModel)
+    env.init_tables()
+
+    assert env["test_model"].create_many([])._ids == []
+
+    env["test_model"].create({"test": "a"})
+    records = env["test_model"].create_many(
+        [{"test": "b", "test2": 2}, {"test2": 3}, {"test": "d", "id": 100}]
+    )
+    assert records._ids == [2, 3, 4]
+    assert env["test_model"].search([])._ids == [1, 2, 3, 4]
+    assert [(record.test, record.test2) for record in records] == [("b", 2), (None, 3), ("d", None)]
+    assert env["test_model"].create({"test": "e"})._ids == [5]
+
+    with pytest.raises(SillyORMException) as e_info:
+        env["test_model"].create_many([{"test": "f"}, {"test2": "g"}])
+    assert str(e_info.value) == "Integer value must be int"
+    assert env["test_model"].search_count([]) == 5
+
+
+@pytest.mark.parametrize("db_conn_fn", [(sqlite_conn), (pg_conn)])
+def test_create_without_returning(tmp_path, db_conn_fn):
+    class TestModel(sillyorm.model.Model):
+        _name = "test_model"
+
+        test = sillyorm.fields.String()
+
+    env = sillyorm.Environment(db_conn_fn(tmp_path).cursor())
+    env.register_model(TestModel)
+    env.init_tables()
+
+    env.cr.supports_returning = False
+    assert env["test_model"].create({"test": "a"})._ids == [1]
+    assert env["test_model"].create({})._ids == [2]
+    assert [record.test for record in env["test_model"].search([])] == ["a", None]
+
+
+@pytest.mark.parametrize("db_conn_fn", [(sqlite_conn), (pg_conn)])
+def test_empty_noop(tmp_path, db_conn_fn):
+    class TestModel(sillyorm.model.Model):
+        _name = "test_model"
+
+        test = sillyorm.fields.String()
+
+    env = sillyorm.Environment(db_conn_fn(tmp_path).cursor())
+    env.register_model(TestModel)
+    env.init_tables()
+
+    record = env["test_model"].create({"test": "a"})
+    env["test_model"].write({"test": "b"})
+    env["test_model"].delete()
+    record.write({})
+    assert env["test_model"].browse([]) is None
+    assert record.test == "a"
+    assert env["test_model"].search_count([]) == 1
@@ -30,3 +30,37 @@ def test_search_none(env):
         4,
         6,
     ]
+
+
+@with_test_env(False)
+def test_search_in(env):
+    class Test(sillyorm.model.Model):
+        _name = "test"
+
+        s = sillyorm.fields.String()
+        i = sillyorm.fields.Integer()
+
+    env.register_model(Test)
+    env.init_tables()
+
+    env["test"].create({"s": "a", "i": 1})
+    env["test"].create({"s": "b", "i": 2})
+    env["test"].create({"s": "c", "i": 3})
+    env["test"].create({"i": 4})
+
+    assert env["test"].search([("s", "in", ["a", "c"])])._ids == [1, 3]
+    assert env["test"].search([("i", "in", (2, 4))])._ids == [2, 4]
+    assert env["test"].search([("i", "in", [2, 4]), "&", ("s", "=", "b")])._ids == [2]
+    assert env["test"].search([("s", "in", [])])._ids == []
+    domain = [("i", "in", (1, 3))]
+    assert env["test"].search(domain)._ids == [1, 3]
+    assert domain == [("i", "in", (1, 3))]
+    assert env["test"].search([("s", "in", []), "|", ("i", "=", 4)])._ids == [4]
+    assert env["test"].search([("s", "in", ["a", None])])._ids == [1, 4]
+    assert env["test"].search([("s", "in", [None])])._ids == [4]
+    assert env["test"].search([("s", "in", ["a", None]), "&", ("i", "=", 4)])._ids == [4]
+    assert env["test"].search(["!", ("s", "in", ["a", None])])._ids == [2, 3]
+
+    with pytest.raises(SillyORMException) as e_info:
+        env["test"].search([("s", "in", "a")])
+    assert str(e_info.value) == "invalid domain"